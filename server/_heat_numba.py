@@ -0,0 +1,129 @@
+"""Compiled kernels for the mock heat API.
+
+Each kernel has a NumPy fallback with the same signature so the server still runs where numba is not installed.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - depends on the environment
+    njit = None
+
+NUMBA_AVAILABLE = njit is not None
+
+
+if NUMBA_AVAILABLE:
+
+    # The heat kernels are serial on purpose: handlers call them from several threads at once, which numba's
+    # default workqueue threading layer does not support, and a 256x256 pass gains little from prange.
+    @njit(fastmath=True, cache=True)
+    def mock_heat_kernel(heat: np.ndarray, column_terms: np.ndarray, row_terms: np.ndarray) -> None:
+        # heat holds the raw noise on entry; gradient + ridge + scaled noise + clip are fused into one pass.
+        for i in range(heat.shape[0]):
+            row_term = row_terms[i]
+            for j in range(heat.shape[1]):
+                value = column_terms[j] + row_term + heat[i, j] * 0.22
+                heat[i, j] = min(max(value, 0.0), 1.0)
+
+    @njit(fastmath=True, cache=True)
+    def route_heat_kernel(
+        utci: np.ndarray, min_dist: np.ndarray, gradient_x: np.ndarray, gradient_y: np.ndarray
+    ) -> None:
+        # utci holds the raw noise on entry; noise scale + route falloff + gradient + clip are fused into one pass.
+        for i in range(utci.shape[0]):
+            row_term = gradient_y[i]
+            for j in range(utci.shape[1]):
+                value = utci[i, j] * 0.55 + np.exp(min_dist[i, j] * -14.0) * 24.0 + gradient_x[j] + row_term
+                utci[i, j] = min(max(value, 0.0), 40.0)
+
+    # No fastmath on the route helpers: densified points must stay bit-identical for inclusive tile-edge tests.
+    @njit(cache=True)
+    def densify_route(coords: np.ndarray, max_step_deg: float) -> np.ndarray:
+        if coords.shape[0] < 2:
+            return coords.copy()
+
+        segment_count = coords.shape[0] - 1
+        steps = np.empty(segment_count, dtype=np.int64)
+        for index in range(segment_count):
+            max_delta = max(abs(coords[index + 1, 0] - coords[index, 0]), abs(coords[index + 1, 1] - coords[index, 1]))
+            steps[index] = max(1, int(max_delta / max_step_deg))
+
+        points = np.empty((steps.sum() + 1, 2), dtype=np.float64)
+        cursor = 0
+        for index in range(segment_count):
+            start_lng = coords[index, 0]
+            start_lat = coords[index, 1]
+            delta_lng = coords[index + 1, 0] - start_lng
+            delta_lat = coords[index + 1, 1] - start_lat
+            for step in range(steps[index]):
+                ratio = step / steps[index]
+                points[cursor, 0] = start_lng + delta_lng * ratio
+                points[cursor, 1] = start_lat + delta_lat * ratio
+                cursor += 1
+
+        points[cursor, 0] = coords[-1, 0]
+        points[cursor, 1] = coords[-1, 1]
+        return points
+
+    @njit(cache=True)
+    def tile_hits(points: np.ndarray, bounds: np.ndarray, candidates: np.ndarray) -> np.ndarray:
+        # Per candidate tile, stop scanning route points at the first one inside its (inclusive) bounds.
+        hits = np.zeros(candidates.shape[0], dtype=np.bool_)
+        for k in range(candidates.shape[0]):
+            tile = candidates[k]
+            min_lng = bounds[0, tile]
+            min_lat = bounds[1, tile]
+            max_lng = bounds[2, tile]
+            max_lat = bounds[3, tile]
+            for p in range(points.shape[0]):
+                lng = points[p, 0]
+                lat = points[p, 1]
+                if min_lng <= lng <= max_lng and min_lat <= lat <= max_lat:
+                    hits[k] = True
+                    break
+        return hits
+
+else:
+
+    def mock_heat_kernel(heat: np.ndarray, column_terms: np.ndarray, row_terms: np.ndarray) -> None:
+        heat *= 0.22
+        heat += column_terms[None, :]
+        heat += row_terms[:, None]
+        np.clip(heat, 0.0, 1.0, out=heat)
+
+    def route_heat_kernel(
+        utci: np.ndarray, min_dist: np.ndarray, gradient_x: np.ndarray, gradient_y: np.ndarray
+    ) -> None:
+        utci *= 0.55
+        utci += np.exp(min_dist * -14.0) * 24.0
+        utci += gradient_x[None, :]
+        utci += gradient_y[:, None]
+        np.clip(utci, 0.0, 40.0, out=utci)
+
+    def densify_route(coords: np.ndarray, max_step_deg: float) -> np.ndarray:
+        if coords.shape[0] < 2:
+            return coords.copy()
+
+        starts = coords[:-1]
+        deltas = coords[1:] - starts
+        steps = np.maximum(1, (np.abs(deltas).max(axis=1) / max_step_deg).astype(np.int64))
+
+        # One row per interpolated step: segment id plus step-within-segment, no per-step Python loop.
+        segment = np.repeat(np.arange(len(steps)), steps)
+        step_index = np.arange(segment.size) - np.repeat(np.cumsum(steps) - steps, steps)
+        ratio = (step_index / steps[segment])[:, None]
+
+        points = np.empty((segment.size + 1, 2), dtype=np.float64)
+        np.add(starts[segment], deltas[segment] * ratio, out=points[:-1])
+        points[-1] = coords[-1]
+        return points
+
+    def tile_hits(points: np.ndarray, bounds: np.ndarray, candidates: np.ndarray) -> np.ndarray:
+        min_lng, min_lat, max_lng, max_lat = bounds[:, candidates]
+        lng = points[:, 0:1]
+        lat = points[:, 1:2]
+        inside = (lng >= min_lng) & (lng <= max_lng) & (lat >= min_lat) & (lat <= max_lat)
+        return inside.any(axis=0)
@@ -1,30 +1,85 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import functools
 import hashlib
 import json
+import multiprocessing
 import os
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
-from urllib.error import URLError
-from urllib.request import urlopen
+from typing import AsyncIterator, Callable, Dict, List, NamedTuple, Optional, Set, Tuple
 
-import matplotlib.cm as cm
-import matplotlib.colors as mcolors
-import matplotlib.pyplot as plt
+import httpx
+import matplotlib as mpl
 import numpy as np
 import tifffile
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import Depends, FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
+from PIL import Image
 from pydantic import BaseModel
+from scipy.ndimage import zoom
+from scipy.spatial import cKDTree
+from shapely import STRtree, box
+
+# One module name only: numba's on-disk cache records the importing module, so loading the kernels as both
+# server._heat_numba and _heat_numba makes each launch mode's cache break the other.
+from ._heat_numba import densify_route, mock_heat_kernel, route_heat_kernel, tile_hits
 
 ROOT_DIR = Path(__file__).resolve().parent.parent
 RESULTS_DIR = ROOT_DIR / 'server' / 'results'
 DEFAULT_TILE_INDEX_PATH = ROOT_DIR / 'server' / 'data' / 'hk_tiles_index.json'
 TILE_INDEX_PATH = Path(os.getenv('HEAT_TILE_INDEX_PATH', str(DEFAULT_TILE_INDEX_PATH))).expanduser()
+MOCK_PIXEL_NOISE = os.getenv('HEAT_MOCK_PIXEL_NOISE', '').strip().lower() in {'1', 'true', 'yes'}
+NOISE_COARSE_FACTOR = 4
+ROUTE_CACHE_SIZE = 1024
+ROUTE_NEGATIVE_TTL_SECONDS = 60.0
+OSRM_TIMEOUT_SECONDS = 8.0
+SERIES_MAX_WORKERS = min(8, os.cpu_count() or 1)
+SERIES_INLINE_MAX_TILES = 4
+ROUTE_TILE_PAD = 1.25
+# KD-tree query threads; render pool workers drop this to 1 so the pool does not oversubscribe the cores.
+_KDTREE_WORKERS = -1
+
+RouteCacheKey = Tuple[str, float, float, float, float]
+# (row, col) -> (tile bbox, float32 (N, 2) route normalized to that tile), built once per series request.
+SeriesTileRoutes = Dict[Tuple[int, int], Tuple[Tuple[float, float, float, float], np.ndarray]]
+_ROUTE_CACHE: OrderedDict[RouteCacheKey, Tuple[Optional[float], Optional[List[List[float]]]]] = OrderedDict()
+# Route lookups in progress (disk cache, then OSRM); concurrent requests for the same route share one.
+_ROUTE_INFLIGHT: Dict[RouteCacheKey, asyncio.Task] = {}
+# GeoTIFF paths whose .tif/.png pair is known to be on disk; skips the stat calls on repeat requests.
+_GENERATED_OUTPUTS: Set[Path] = set()
+# Manifest text known to be on disk per path; repeat series requests skip both the read and the write.
+_MANIFEST_CONTENTS: Dict[Path, str] = {}
+# Manifests are written from executor threads; compare, write and record happen under this lock.
+_MANIFEST_LOCK = threading.Lock()
+# Per-thread scratch arrays for heat renders (see _scratch_heat_buffer).
+_SCRATCH = threading.local()
+# Keep-alive client for OSRM, opened for the lifetime of the app.
+_OSRM_CLIENT: Optional[httpx.AsyncClient] = None
+
+
+@contextlib.asynccontextmanager
+async def _lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    global _OSRM_CLIENT
+    _OSRM_CLIENT = httpx.AsyncClient(timeout=OSRM_TIMEOUT_SECONDS)
+    try:
+        yield
+    finally:
+        await _OSRM_CLIENT.aclose()
+        _OSRM_CLIENT = None
+        _shutdown_series_process_pool(wait=True)
+
 
-app = FastAPI(title='HeatExposure Mock API')
+app = FastAPI(title='HeatExposure Mock API', lifespan=_lifespan)
 
 DEV_ALLOWED_ORIGINS = [
     'http://localhost:5173',
@@ -120,6 +175,21 @@ def _parse_lng_lat(raw_coord: str, name: str) -> Tuple[float, float]:
     return lng, lat
 
 
+_ROW_KEYS = ('row', 'tile_row', 'r', 'y', 'tile_y')
+_COL_KEYS = ('col', 'tile_col', 'c', 'x', 'tile_x')
+# Flat bounds layouts in the priority order _extract_tile_bounds tries them; GeoJSON geometry stays on the generic path.
+_FLAT_BOUNDS_LAYOUTS: Tuple[Tuple[str, ...], ...] = (
+    ('bounds',),
+    ('bbox',),
+    ('min_lng', 'min_lat', 'max_lng', 'max_lat'),
+    ('left', 'bottom', 'right', 'top'),
+    ('extent',),
+)
+
+TileBoundsReader = Callable[[Dict[str, object]], Optional[Tuple[float, float, float, float]]]
+TileRowColReader = Callable[[Dict[str, object]], Tuple[Optional[int], Optional[int]]]
+
+
 def _to_int(value: object) -> Optional[int]:
     if isinstance(value, bool):
         return None
@@ -217,35 +287,68 @@ def _extract_tile_bounds(tile: Dict[str, object]) -> Optional[Tuple[float, float
 
 
 def _extract_row_col(tile: Dict[str, object]) -> Tuple[Optional[int], Optional[int]]:
-    row_candidates = [tile.get('row'), tile.get('tile_row'), tile.get('r'), tile.get('y'), tile.get('tile_y')]
-    col_candidates = [tile.get('col'), tile.get('tile_col'), tile.get('c'), tile.get('x'), tile.get('tile_x')]
+    row_candidates = [tile.get(key) for key in _ROW_KEYS]
+    col_candidates = [tile.get(key) for key in _COL_KEYS]
 
     properties = tile.get('properties')
     if isinstance(properties, dict):
-        row_candidates.extend(
-            [
-                properties.get('row'),
-                properties.get('tile_row'),
-                properties.get('r'),
-                properties.get('y'),
-                properties.get('tile_y'),
-            ]
-        )
-        col_candidates.extend(
-            [
-                properties.get('col'),
-                properties.get('tile_col'),
-                properties.get('c'),
-                properties.get('x'),
-                properties.get('tile_x'),
-            ]
-        )
+        row_candidates.extend(properties.get(key) for key in _ROW_KEYS)
+        col_candidates.extend(properties.get(key) for key in _COL_KEYS)
 
     row = next((parsed for candidate in row_candidates if (parsed := _to_int(candidate)) is not None), None)
     col = next((parsed for candidate in col_candidates if (parsed := _to_int(candidate)) is not None), None)
     return row, col
 
 
+def _is_number(value: object) -> bool:
+    # Exact type checks: bool is an int subclass but never a valid coordinate or index.
+    return type(value) is float or type(value) is int
+
+
+def _flat_bounds_reader(layout_index: int) -> TileBoundsReader:
+    keys = _FLAT_BOUNDS_LAYOUTS[layout_index]
+    shadowing_keys = tuple(key for layout in _FLAT_BOUNDS_LAYOUTS[:layout_index] for key in layout)
+
+    def read(tile: Dict[str, object]) -> Optional[Tuple[float, float, float, float]]:
+        values = tile.get(keys[0]) if len(keys) == 1 else [tile.get(key) for key in keys]
+        if not (isinstance(values, list) and len(values) == 4 and all(map(_is_number, values))):
+            return None
+        if any(key in tile for key in shadowing_keys):
+            return None
+        return float(values[0]), float(values[1]), float(values[2]), float(values[3])
+
+    return read
+
+
+def _tile_bounds_reader(sample: Dict[str, object]) -> TileBoundsReader:
+    # Specialize on the first tile's layout; tiles that don't fit it take the generic path, so results are unchanged.
+    for layout_index in range(len(_FLAT_BOUNDS_LAYOUTS)):
+        read = _flat_bounds_reader(layout_index)
+        if read(sample) is not None:
+            return lambda tile: read(tile) or _extract_tile_bounds(tile)
+    return _extract_tile_bounds
+
+
+def _tile_row_col_reader(sample: Dict[str, object]) -> TileRowColReader:
+    row_index = next((index for index, key in enumerate(_ROW_KEYS) if type(sample.get(key)) is int), None)
+    col_index = next((index for index, key in enumerate(_COL_KEYS) if type(sample.get(key)) is int), None)
+    if row_index is None or col_index is None:
+        return _extract_row_col
+
+    row_key = _ROW_KEYS[row_index]
+    col_key = _COL_KEYS[col_index]
+    shadowing_keys = _ROW_KEYS[:row_index] + _COL_KEYS[:col_index]
+
+    def read(tile: Dict[str, object]) -> Tuple[Optional[int], Optional[int]]:
+        row = tile.get(row_key)
+        col = tile.get(col_key)
+        if type(row) is int and type(col) is int and not any(key in tile for key in shadowing_keys):
+            return row, col
+        return _extract_row_col(tile)
+
+    return read
+
+
 def _extract_raw_tiles(payload: object) -> List[object]:
     if isinstance(payload, list):
         return payload
@@ -259,10 +362,7 @@ def _extract_raw_tiles(payload: object) -> List[object]:
     return []
 
 
-def _load_tile_index(path: Path = TILE_INDEX_PATH) -> List[Dict[str, object]]:
-    if not path.exists():
-        return []
-
+def _parse_tile_index(path: Path) -> List[Dict[str, object]]:
     try:
         payload = json.loads(path.read_text(encoding='utf-8'))
     except (OSError, json.JSONDecodeError):
@@ -272,14 +372,20 @@ def _load_tile_index(path: Path = TILE_INDEX_PATH) -> List[Dict[str, object]]:
     if not raw_tiles:
         return []
 
+    sample = next((tile for tile in raw_tiles if isinstance(tile, dict)), None)
+    if sample is None:
+        return []
+    read_row_col = _tile_row_col_reader(sample)
+    read_bounds = _tile_bounds_reader(sample)
+
     parsed_tiles: List[Dict[str, object]] = []
     for tile in raw_tiles:
         if not isinstance(tile, dict):
             continue
 
-        row, col = _extract_row_col(tile)
+        row, col = read_row_col(tile)
 
-        bounds = _extract_tile_bounds(tile)
+        bounds = read_bounds(tile)
         if row is None or col is None or bounds is None:
             continue
 
@@ -301,6 +407,51 @@ def _load_tile_index(path: Path = TILE_INDEX_PATH) -> List[Dict[str, object]]:
     return parsed_tiles
 
 
+class TileIndexState(NamedTuple):
+    tiles: List[Dict[str, object]]
+    lookup: Dict[Tuple[int, int], Dict[str, object]]
+    tree: Optional[STRtree]
+    # Struct-of-arrays view of the tiles: bounds rows are min_lng, min_lat, max_lng, max_lat; rowcol is (N, 2).
+    bounds: np.ndarray
+    rowcol: np.ndarray
+
+
+def _build_tile_index_state(tile_index: List[Dict[str, object]]) -> TileIndexState:
+    bounds = np.array(
+        [[tile[key] for tile in tile_index] for key in ('min_lng', 'min_lat', 'max_lng', 'max_lat')],
+        dtype=np.float64,
+    ).reshape(4, len(tile_index))
+    rowcol = np.array([(tile['row'], tile['col']) for tile in tile_index], dtype=np.int64).reshape(-1, 2)
+    bounds.setflags(write=False)
+    rowcol.setflags(write=False)
+    return TileIndexState(
+        tiles=tile_index,
+        lookup=_tile_lookup_by_row_col(tile_index),
+        tree=STRtree(box(*bounds)) if tile_index else None,
+        bounds=bounds,
+        rowcol=rowcol,
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _load_tile_index_cached(path_str: str, mtime_ns: int) -> TileIndexState:
+    # mtime_ns is only part of the cache key: rewriting the index file invalidates the entry.
+    return _build_tile_index_state(_parse_tile_index(Path(path_str)))
+
+
+def _tile_index_state(path: Path = TILE_INDEX_PATH) -> TileIndexState:
+    # Parsed tiles, lookup, STRtree and bound columns share one parse; callers must treat them as read-only.
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:
+        return _build_tile_index_state([])
+    return _load_tile_index_cached(str(path), mtime_ns)
+
+
+def _load_tile_index(path: Path = TILE_INDEX_PATH) -> List[Dict[str, object]]:
+    return _tile_index_state(path).tiles
+
+
 def _tile_lookup_by_row_col(tile_index: List[Dict[str, object]]) -> Dict[Tuple[int, int], Dict[str, object]]:
     lookup: Dict[Tuple[int, int], Dict[str, object]] = {}
     for tile in tile_index:
@@ -308,136 +459,132 @@ def _tile_lookup_by_row_col(tile_index: List[Dict[str, object]]) -> Dict[Tuple[i
     return lookup
 
 
-def _densify_route(route_coords: List[List[float]], max_step_deg: float = 0.0003) -> List[Tuple[float, float]]:
-    if len(route_coords) < 2:
-        return [(coord[0], coord[1]) for coord in route_coords]
-
-    points: List[Tuple[float, float]] = []
-    for index in range(len(route_coords) - 1):
-        start_lng, start_lat = route_coords[index]
-        end_lng, end_lat = route_coords[index + 1]
-        delta_lng = end_lng - start_lng
-        delta_lat = end_lat - start_lat
-        max_delta = max(abs(delta_lng), abs(delta_lat))
-        steps = max(1, int(max_delta / max_step_deg))
-
-        for step in range(steps):
-            ratio = step / steps
-            points.append((start_lng + delta_lng * ratio, start_lat + delta_lat * ratio))
+def _densify_route(route_array: np.ndarray, max_step_deg: float = 0.0003) -> np.ndarray:
+    return densify_route(np.ascontiguousarray(route_array, dtype=np.float64).reshape(-1, 2), max_step_deg)
 
-    last_lng, last_lat = route_coords[-1]
-    points.append((last_lng, last_lat))
-    return points
 
+def _match_route_tiles(route_array: np.ndarray, tile_state: TileIndexState) -> List[Tuple[int, int]]:
+    if tile_state.tree is None or len(route_array) < 2:
+        return []
 
-def _match_route_tiles(route_coords: List[List[float]], tile_index: List[Dict[str, object]]) -> List[Tuple[int, int]]:
-    if not tile_index or len(route_coords) < 2:
+    sampled_points = _densify_route(route_array)
+    # The STRtree prunes to tiles overlapping the route's bounding box; the exact
+    # inclusive point-in-box test then only runs against those candidates.
+    candidates = tile_state.tree.query(box(*sampled_points.min(axis=0), *sampled_points.max(axis=0)))
+    if candidates.size == 0:
         return []
 
-    sampled_points = _densify_route(route_coords)
-    matched: Set[Tuple[int, int]] = set()
+    hits = tile_hits(sampled_points, tile_state.bounds, candidates)
+    matched = np.unique(tile_state.rowcol[candidates[hits]], axis=0)
+    return [(int(row), int(col)) for row, col in matched]
 
-    for lng, lat in sampled_points:
-        for tile in tile_index:
-            min_lng = float(tile['min_lng'])
-            min_lat = float(tile['min_lat'])
-            max_lng = float(tile['max_lng'])
-            max_lat = float(tile['max_lat'])
 
-            if min_lng <= lng <= max_lng and min_lat <= lat <= max_lat:
-                matched.add((int(tile['row']), int(tile['col'])))
+def _stable_seed(token: str) -> int:
+    # Only needs to be deterministic across processes (unlike hash()); no cryptographic property required.
+    return zlib.crc32(token.encode('utf-8'))
 
-    return sorted(matched)
 
+def _fill_noise(rng: np.random.Generator, out: np.ndarray, distribution: str = 'uniform') -> None:
+    draw = rng.standard_normal if distribution == 'normal' else rng.random
+    if MOCK_PIXEL_NOISE:
+        draw(dtype=np.float32, out=out)
+        return
 
-def _stable_seed(token: str) -> int:
-    return int(hashlib.sha256(token.encode('utf-8')).hexdigest()[:8], 16)
+    # Draw on a coarse grid and bilinearly upsample: smoother (lower-frequency) noise, far fewer RNG calls.
+    height, width = out.shape
+    coarse_height = max(2, height // NOISE_COARSE_FACTOR)
+    coarse_width = max(2, width // NOISE_COARSE_FACTOR)
+    coarse = draw(size=(coarse_height, coarse_width), dtype=np.float32)
+    zoom(coarse, (height / coarse_height, width / coarse_width), output=out, order=1)
 
 
-def _mock_heat_array(seed: int, size: int = 256) -> np.ndarray:
-    rng = np.random.default_rng(seed)
-    y_grid, x_grid = np.mgrid[0:size, 0:size].astype(np.float32)
+@functools.lru_cache(maxsize=4)
+def _mock_axis_terms(size: int) -> Tuple[np.ndarray, np.ndarray]:
+    # base gradient + ridge are separable: one sin/cos per column/row instead of per pixel.
+    axis = np.arange(size, dtype=np.float64)
+    column_terms = axis * 0.6 / size + np.sin(axis / 17.0) * 0.1
+    row_terms = axis * 0.4 / size + np.cos(axis / 29.0) * 0.08
+    column_terms.setflags(write=False)
+    row_terms.setflags(write=False)
+    return column_terms, row_terms
 
-    base_gradient = (x_grid * 0.6 + y_grid * 0.4) / size
-    ridge = np.sin(x_grid / 17.0) * 0.1 + np.cos(y_grid / 29.0) * 0.08
-    noise = rng.random((size, size), dtype=np.float32) * 0.22
 
-    heat = base_gradient + ridge + noise
-    heat = np.clip(heat, 0.0, 1.0)
-    return heat.astype(np.float32)
+def _mock_heat_array(seed: int, size: int = 256, out: Optional[np.ndarray] = None) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    heat = np.empty((size, size), dtype=np.float32) if out is None else out
+    _fill_noise(rng, heat)
+    mock_heat_kernel(heat, *_mock_axis_terms(size))
+    return heat
+
+
+# GeoKeyDirectoryTag for EPSG:4326 (header, then one KeyID/TIFFTagLocation/Count/Value entry per row).
+# fmt: off
+_GEOKEY_DIRECTORY = (
+    1, 1, 0, 7,
+    1024, 0, 1, 2,
+    1025, 0, 1, 1,
+    2048, 0, 1, 4326,
+    2049, 34737, 7, 0,
+    2054, 0, 1, 9102,
+    2057, 34736, 1, 1,
+    2059, 34736, 1, 0,
+)
+# fmt: on
+_GEOKEY_DIRECTORY_TAG = (34735, 'H', len(_GEOKEY_DIRECTORY), _GEOKEY_DIRECTORY, False)
 
 
 def _write_geotiff(heat: np.ndarray, path: Path, bbox: Tuple[float, float, float, float]) -> None:
-    min_lng, _min_lat, max_lng, max_lat = bbox
+    min_lng, min_lat, max_lng, max_lat = bbox
     height, width = heat.shape
     pixel_width = (max_lng - min_lng) / float(width)
-    pixel_height = (bbox[3] - bbox[1]) / float(height)
+    pixel_height = (max_lat - min_lat) / float(height)
 
     model_pixel_scale = (pixel_width, pixel_height, 0.0)
     model_tie_point = (0.0, 0.0, 0.0, min_lng, max_lat, 0.0)
-    geokey_directory = (
-        1,
-        1,
-        0,
-        7,
-        1024,
-        0,
-        1,
-        2,
-        1025,
-        0,
-        1,
-        1,
-        2048,
-        0,
-        1,
-        4326,
-        2049,
-        34737,
-        7,
-        0,
-        2054,
-        0,
-        1,
-        9102,
-        2057,
-        34736,
-        1,
-        1,
-        2059,
-        34736,
-        1,
-        0,
-    )
-
     tifffile.imwrite(
         path,
         heat,
-        dtype=np.float32,
+        photometric='minisblack',
+        tile=(256, 256),
+        compression='zlib',
+        compressionargs={'level': 1},
+        predictor=3,
+        bigtiff=False,
         metadata=None,
         extratags=[
             (33550, 'd', 3, model_pixel_scale, False),
             (33922, 'd', 6, model_tie_point, False),
-            (34735, 'H', len(geokey_directory), geokey_directory, False),
+            _GEOKEY_DIRECTORY_TAG,
         ],
     )
 
 
-def _discrete_utci_colormap() -> Tuple[mcolors.ListedColormap, mcolors.BoundaryNorm, List[float]]:
-    boundaries = [0.0, 10.0, 20.0, 25.0, 28.0, 31.0, 34.0, 37.0, 40.0]
+def _discrete_utci_lut(boundaries: List[float]) -> np.ndarray:
     color_count = len(boundaries) - 1
-    base_cmap = cm.get_cmap('jet', color_count)
-    colors = base_cmap(np.linspace(0, 1, color_count))
-    cmap = mcolors.ListedColormap(colors)
-    norm = mcolors.BoundaryNorm(boundaries, cmap.N, clip=True)
-    return cmap, norm, boundaries
+    base_cmap = mpl.colormaps['jet'].resampled(color_count)
+    lut = (base_cmap(np.linspace(0, 1, color_count)) * 255).astype(np.uint8)
+    lut[:, 3] = int(0.65 * 255)
+    return lut
+
+
+_BOUNDARIES = [0.0, 10.0, 20.0, 25.0, 28.0, 31.0, 34.0, 37.0, 40.0]
+_DISCRETE_LUT_U8 = _discrete_utci_lut(_BOUNDARIES)
+_INNER_BOUNDARIES = np.asarray(_BOUNDARIES[1:-1], dtype=np.float32)
+
+
+def _utci_bin_index(heat: np.ndarray) -> np.ndarray:
+    # Counting crossed class edges equals searchsorted(side='right') here, but stays uint8 and vectorizes.
+    bin_index = np.zeros(heat.shape, dtype=np.uint8)
+    for boundary in _INNER_BOUNDARIES:
+        bin_index += heat >= boundary
+    return bin_index
 
 
 def _write_overlay_png_discrete(heat: np.ndarray, path: Path) -> None:
-    cmap, norm, _boundaries = _discrete_utci_colormap()
-    rgba = cmap(norm(heat))
-    rgba[..., 3] = 0.65
-    plt.imsave(path, rgba)
+    # Palette PNG: one byte per pixel plus an 8-entry RGBA palette (tRNS) decodes to the same RGBA as a truecolor write.
+    image = Image.fromarray(_utci_bin_index(heat))
+    image.putpalette(_DISCRETE_LUT_U8.tobytes(), rawmode='RGBA')
+    image.save(path, compress_level=1)
 
 
 def _expand_bbox(bbox: Tuple[float, float, float, float], ratio: float = 0.05) -> Tuple[float, float, float, float]:
@@ -450,28 +597,32 @@ def _expand_bbox(bbox: Tuple[float, float, float, float], ratio: float = 0.05) -
     return min_lng - pad_lng, min_lat - pad_lat, max_lng + pad_lng, max_lat + pad_lat
 
 
-def _bbox_from_route(route_coords: List[List[float]]) -> Tuple[float, float, float, float]:
-    lngs = [coord[0] for coord in route_coords]
-    lats = [coord[1] for coord in route_coords]
-    return min(lngs), min(lats), max(lngs), max(lats)
+def _bbox_from_route(route_array: np.ndarray) -> Tuple[float, float, float, float]:
+    mins = route_array.min(axis=0)
+    maxs = route_array.max(axis=0)
+    return float(mins[0]), float(mins[1]), float(maxs[0]), float(maxs[1])
 
 
-def _fetch_route_geometry(
+async def _request_route_geometry(
     start: Tuple[float, float],
     end: Tuple[float, float],
     profile: str,
 ) -> Optional[List[List[float]]]:
-    allowed_profiles = {'walking', 'driving', 'running'}
-    safe_profile = profile if profile in allowed_profiles else 'walking'
     url = (
-        f'https://router.project-osrm.org/route/v1/{safe_profile}/'
+        f'https://router.project-osrm.org/route/v1/{profile}/'
         f'{start[0]},{start[1]};{end[0]},{end[1]}?overview=full&geometries=geojson'
     )
 
     try:
-        with urlopen(url, timeout=8) as response:
-            payload = json.loads(response.read().decode('utf-8'))
-    except (URLError, TimeoutError, json.JSONDecodeError):
+        if _OSRM_CLIENT is not None:
+            response = await _OSRM_CLIENT.get(url)
+        else:
+            # Outside the app lifespan there is no shared client; use a one-off connection.
+            async with httpx.AsyncClient(timeout=OSRM_TIMEOUT_SECONDS) as client:
+                response = await client.get(url)
+        response.raise_for_status()
+        payload = response.json()
+    except (httpx.HTTPError, json.JSONDecodeError):
         return None
 
     geometry = payload.get('routes', [{}])[0].get('geometry', {})
@@ -482,6 +633,107 @@ def _fetch_route_geometry(
     return [[float(point[0]), float(point[1])] for point in coords]
 
 
+def _route_cache_file(key: RouteCacheKey) -> Path:
+    digest = hashlib.blake2b(repr(key).encode('utf-8'), digest_size=16).hexdigest()
+    return RESULTS_DIR / '_route_cache' / f'{digest}.json'
+
+
+def _remember_route(key: RouteCacheKey, coords: Optional[List[List[float]]]) -> None:
+    expires_at = None if coords is not None else time.monotonic() + ROUTE_NEGATIVE_TTL_SECONDS
+    _ROUTE_CACHE[key] = (expires_at, coords)
+    _ROUTE_CACHE.move_to_end(key)
+    while len(_ROUTE_CACHE) > ROUTE_CACHE_SIZE:
+        _ROUTE_CACHE.popitem(last=False)
+
+
+def _cached_route(key: RouteCacheKey) -> Tuple[bool, Optional[List[List[float]]]]:
+    entry = _ROUTE_CACHE.get(key)
+    if entry is not None:
+        expires_at, coords = entry
+        if expires_at is None or expires_at > time.monotonic():
+            _ROUTE_CACHE.move_to_end(key)
+            return True, coords
+        del _ROUTE_CACHE[key]
+    return False, None
+
+
+def _read_route_cache_file(key: RouteCacheKey) -> Optional[List[List[float]]]:
+    try:
+        return json.loads(_route_cache_file(key).read_text(encoding='utf-8'))
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def _write_route_cache_file(key: RouteCacheKey, coords: List[List[float]]) -> None:
+    cache_file = _route_cache_file(key)
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(json.dumps(coords), encoding='utf-8')
+    except OSError:
+        pass
+
+
+async def _fetch_route_geometry(
+    start: Tuple[float, float],
+    end: Tuple[float, float],
+    profile: str,
+) -> Optional[List[List[float]]]:
+    allowed_profiles = {'walking', 'driving', 'running'}
+    safe_profile = profile if profile in allowed_profiles else 'walking'
+    # ~1 m rounding so nearby clicks share a cache entry.
+    key = (safe_profile, round(start[0], 5), round(start[1], 5), round(end[0], 5), round(end[1], 5))
+
+    hit, coords = _cached_route(key)
+    if hit:
+        return coords
+
+    task = _ROUTE_INFLIGHT.get(key)
+    if task is None:
+        task = asyncio.create_task(_load_and_remember_route(key, start, end, profile=safe_profile))
+        _ROUTE_INFLIGHT[key] = task
+        task.add_done_callback(lambda _task: _ROUTE_INFLIGHT.pop(key, None))
+    # shield: one caller disconnecting must not cancel the lookup other requests are waiting on.
+    return await asyncio.shield(task)
+
+
+async def _load_and_remember_route(
+    key: RouteCacheKey,
+    start: Tuple[float, float],
+    end: Tuple[float, float],
+    profile: str,
+) -> Optional[List[List[float]]]:
+    # Disk cache I/O runs on the thread pool; the in-memory cache is only touched from the event loop.
+    coords = await asyncio.to_thread(_read_route_cache_file, key)
+    if coords is None:
+        coords = await _request_route_geometry(start, end, profile=profile)
+        if coords is not None:
+            await asyncio.to_thread(_write_route_cache_file, key, coords)
+
+    _remember_route(key, coords)
+    return coords
+
+
+def _load_and_match_route_tiles(route_array: np.ndarray) -> Tuple[TileIndexState, List[Tuple[int, int]]]:
+    tile_state = _tile_index_state()
+    return tile_state, _match_route_tiles(route_array=route_array, tile_state=tile_state)
+
+
+async def _resolve_route_and_tiles(
+    start: Tuple[float, float],
+    end: Tuple[float, float],
+    profile: str,
+) -> Tuple[np.ndarray, TileIndexState, List[Tuple[int, int]]]:
+    route_coords = await _fetch_route_geometry(start, end, profile=profile)
+    if route_coords is None:
+        route_coords = [[start[0], start[1]], [end[0], end[1]]]
+    # Converted once; tile matching, the bbox and route sampling all read this (N, 2) array.
+    route_array = np.asarray(route_coords, dtype=np.float64)
+
+    # Loading a changed tile index and matching a long route are CPU/disk work; keep them off the event loop.
+    tile_state, route_tiles = await asyncio.to_thread(_load_and_match_route_tiles, route_array)
+    return route_array, tile_state, route_tiles
+
+
 def _parse_hours(start_hour: Optional[int], n_hours: Optional[int], hours: Optional[str]) -> List[int]:
     if start_hour is not None and n_hours is not None:
         if n_hours <= 0:
@@ -512,80 +764,327 @@ def _parse_hours(start_hour: Optional[int], n_hours: Optional[int], hours: Optio
     raise HTTPException(status_code=400, detail='provide start_hour+n_hours or hours.')
 
 
+def _sample_route(route_array: np.ndarray, n_points: int = 128) -> np.ndarray:
+    # Resample uniformly by arc length so curvy stretches are not undersampled relative to straight ones.
+    segment_lengths = np.hypot(*np.diff(route_array, axis=0).T)
+    arc_length = np.concatenate(([0.0], np.cumsum(segment_lengths)))
+    if arc_length[-1] <= 0.0:
+        return route_array[:1].astype(np.float32)
+
+    targets = np.linspace(0.0, arc_length[-1], n_points)
+    sampled_lng = np.interp(targets, arc_length, route_array[:, 0])
+    sampled_lat = np.interp(targets, arc_length, route_array[:, 1])
+    return np.column_stack((sampled_lng, sampled_lat)).astype(np.float32)
+
+
+def _normalize_route(sampled_route: np.ndarray, bbox: Tuple[float, float, float, float]) -> np.ndarray:
+    min_lng, min_lat, max_lng, max_lat = bbox
+    width = max(max_lng - min_lng, 1e-6)
+    height = max(max_lat - min_lat, 1e-6)
+
+    route_norm_x = (sampled_route[:, 0] - min_lng) / width
+    route_norm_y = (sampled_route[:, 1] - min_lat) / height
+    # float32 explicitly: a NumPy float64 bbox value would otherwise promote the result to float64.
+    return np.column_stack((route_norm_x, route_norm_y)).astype(np.float32, copy=False)
+
+
+def _clip_route_to_tile(route_norm: np.ndarray) -> np.ndarray:
+    # Keep points within ROUTE_TILE_PAD tile widths of the tile. Anything farther adds under
+    # exp(-14 * pad) * 24 ~ 6e-7 to any pixel, below float32 resolution at the gradient floor.
+    pad = ROUTE_TILE_PAD
+    inside = np.all((route_norm >= -pad) & (route_norm <= 1.0 + pad), axis=1)
+    if inside.any():
+        return route_norm[inside]
+
+    # Nothing near the tile: one point, the closest to the tile centre, yields the same flat falloff.
+    nearest = np.argmin(np.sum(np.square(route_norm - 0.5), axis=1))
+    return route_norm[nearest : nearest + 1]
+
+
+@functools.lru_cache(maxsize=4)
+def _route_grid(size: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    axis = np.arange(size, dtype=np.float32) / (size - 1)
+    grid_x = axis[None, :]
+    grid_y = axis[:, None]
+
+    grid_points = np.column_stack(
+        (np.broadcast_to(grid_x, (size, size)).ravel(), np.broadcast_to(grid_y, (size, size)).ravel())
+    ).astype(np.float64)
+    # broad_gradient = 0.35 + 0.65 * (0.5 * grid_x + 0.5 * grid_y), split per axis with the 8.0 offset folded in.
+    gradient_x = 8.0 + (0.35 + 0.325 * grid_x) * 9.0
+    gradient_y = (0.325 * grid_y) * 9.0
+
+    for array in (grid_points, gradient_x, gradient_y):
+        array.setflags(write=False)
+    return grid_points, gradient_x, gradient_y
+
+
 def _generate_route_weighted_heat(
     seed: int,
-    bbox: Tuple[float, float, float, float],
-    route_coords: List[List[float]],
+    route_norm: np.ndarray,
     size: int = 256,
+    out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
     rng = np.random.default_rng(seed)
-    min_lng, min_lat, max_lng, max_lat = bbox
+    grid_points, gradient_x, gradient_y = _route_grid(size)
+
+    route_tree = cKDTree(route_norm)
+    min_dist, _ = route_tree.query(grid_points, k=1, workers=_KDTREE_WORKERS)
+
+    utci = np.empty((size, size), dtype=np.float32) if out is None else out
+    _fill_noise(rng, utci, distribution='normal')
+    route_heat_kernel(utci, min_dist.reshape(size, size), gradient_x.ravel(), gradient_y.ravel())
+    return utci
+
+
+def _scratch_heat_buffer(size: int) -> np.ndarray:
+    # One render buffer per thread (sync handlers and inline renders run on thread pools); valid until its next use.
+    buffer = getattr(_SCRATCH, 'heat', None)
+    if buffer is None or buffer.shape != (size, size):
+        buffer = np.empty((size, size), dtype=np.float32)
+        _SCRATCH.heat = buffer
+    return buffer
 
-    width = max(max_lng - min_lng, 1e-6)
-    height = max(max_lat - min_lat, 1e-6)
 
-    step = max(1, len(route_coords) // 180)
-    sampled = route_coords[::step]
-    if sampled[-1] != route_coords[-1]:
-        sampled.append(route_coords[-1])
+def _outputs_exist(tif_file: Path, png_file: Path) -> bool:
+    if tif_file in _GENERATED_OUTPUTS:
+        return True
+    if tif_file.exists() and png_file.exists():
+        _GENERATED_OUTPUTS.add(tif_file)
+        return True
+    return False
 
-    route_array = np.array(sampled, dtype=np.float32)
-    route_norm_x = (route_array[:, 0] - min_lng) / width
-    route_norm_y = (route_array[:, 1] - min_lat) / height
 
-    y_index, x_index = np.mgrid[0:size, 0:size].astype(np.float32)
-    grid_x = x_index / (size - 1)
-    grid_y = y_index / (size - 1)
+def _write_compute_manifest(results_dir: Path, date: str, hour: int, route_tiles: List[Tuple[int, int]]) -> None:
+    manifest_file = results_dir / date.replace('-', '') / f'{hour:02d}' / 'compute_manifest.json'
+    content = HeatComputeManifest(date=date, hour=hour, route_tiles=route_tiles).model_dump_json(indent=2)
+    # Without the lock, two requests for the same hour could leave the file holding one route's tiles
+    # while the cache records the other's, and that route would then never rewrite it.
+    with _MANIFEST_LOCK:
+        if _MANIFEST_CONTENTS.get(manifest_file) == content:
+            return
 
-    dx = grid_x[..., None] - route_norm_x[None, None, :]
-    dy = grid_y[..., None] - route_norm_y[None, None, :]
-    dist = np.sqrt(dx * dx + dy * dy)
-    min_dist = np.min(dist, axis=2)
+        try:
+            unchanged = manifest_file.read_text(encoding='utf-8') == content
+        except OSError:
+            unchanged = False
+        if not unchanged:
+            manifest_file.parent.mkdir(parents=True, exist_ok=True)
+            manifest_file.write_text(content, encoding='utf-8')
+        _MANIFEST_CONTENTS[manifest_file] = content
+
+
+def _series_tile_files(results_dir: Path, date: str, hour: int, row: int, col: int) -> Tuple[Path, Path]:
+    tile_output_dir = results_dir / date.replace('-', '') / f'{hour:02d}' / 'tiles'
+    tile_prefix = f'r{row}_c{col}'
+    return tile_output_dir / f'{tile_prefix}.tif', tile_output_dir / f'{tile_prefix}.png'
+
+
+def _pending_series_tiles(
+    results_dir: Path,
+    date: str,
+    hour: int,
+    tile_routes: SeriesTileRoutes,
+) -> List[Tuple[int, int]]:
+    missing = [
+        (row, col)
+        for row, col in tile_routes
+        if _series_tile_files(results_dir, date, hour, row, col)[0] not in _GENERATED_OUTPUTS
+    ]
+    if not missing:
+        return []
 
-    route_heat = np.exp(-min_dist * 14.0)
-    broad_gradient = 0.35 + 0.65 * (0.5 * grid_x + 0.5 * grid_y)
-    noise = rng.normal(loc=0.0, scale=0.55, size=(size, size)).astype(np.float32)
+    # One directory listing per hour instead of two stat calls per tile.
+    tile_dir = _series_tile_files(results_dir, date, hour, *missing[0])[0].parent
+    try:
+        with os.scandir(tile_dir) as entries:
+            existing = {entry.name for entry in entries}
+    except OSError:
+        return missing
+
+    pending: List[Tuple[int, int]] = []
+    for row, col in missing:
+        tif_file, png_file = _series_tile_files(results_dir, date, hour, row, col)
+        if tif_file.name in existing and png_file.name in existing:
+            _GENERATED_OUTPUTS.add(tif_file)
+        else:
+            pending.append((row, col))
+    return pending
+
+
+def _pending_series_work(
+    results_dir: Path,
+    date: str,
+    hours: List[int],
+    tile_routes: SeriesTileRoutes,
+) -> List[Tuple[int, int, int]]:
+    return [
+        (hour, row, col)
+        for hour in hours
+        for row, col in _pending_series_tiles(results_dir, date, hour, tile_routes)
+    ]
+
+
+def _series_tile_routes(
+    route_array: np.ndarray,
+    route_tiles: List[Tuple[int, int]],
+    tile_lookup: Dict[Tuple[int, int], Dict[str, object]],
+) -> SeriesTileRoutes:
+    # Route sampling and per-tile normalization do not depend on the hour; do them once per request.
+    sampled_route = _sample_route(route_array)
+    tile_routes: SeriesTileRoutes = {}
+    for row, col in route_tiles:
+        tile_meta = tile_lookup.get((row, col))
+        if not tile_meta:
+            continue
 
-    utci = 8.0 + route_heat * 24.0 + broad_gradient * 9.0 + noise
-    utci = np.clip(utci, 0.0, 40.0)
-    return utci.astype(np.float32)
+        tile_bbox = (
+            float(tile_meta['min_lng']),
+            float(tile_meta['min_lat']),
+            float(tile_meta['max_lng']),
+            float(tile_meta['max_lat']),
+        )
+        tile_route = _clip_route_to_tile(_normalize_route(sampled_route, tile_bbox))
+        tile_routes[(row, col)] = (tile_bbox, tile_route)
+    return tile_routes
+
+
+def _render_series_tile(
+    results_dir: Path,
+    date: str,
+    hour: int,
+    row: int,
+    col: int,
+    tile_bbox: Tuple[float, float, float, float],
+    route_norm: np.ndarray,
+    start: str,
+    end: str,
+) -> None:
+    tif_file, png_file = _series_tile_files(results_dir, date, hour, row, col)
+    if _outputs_exist(tif_file, png_file):
+        return
+
+    tif_file.parent.mkdir(parents=True, exist_ok=True)
+    seed = _stable_seed(f'{date}-{hour}-{row}-{col}-{start}-{end}')
+    heat = _generate_route_weighted_heat(seed=seed, route_norm=route_norm, out=_scratch_heat_buffer(256))
+    _write_geotiff(heat, tif_file, tile_bbox)
+    _write_overlay_png_discrete(heat, png_file)
+    _GENERATED_OUTPUTS.add(tif_file)
+
+
+def _series_hour_result(
+    date: str,
+    hour: int,
+    route_tiles: List[Tuple[int, int]],
+    tile_routes: SeriesTileRoutes,
+) -> HeatSeriesHourResult:
+    date_folder = date.replace('-', '')
+    hour_folder = f'{hour:02d}'
 
+    hour_tile_results: List[HeatTileResult] = []
+    for row, col in route_tiles:
+        tile_route = tile_routes.get((row, col))
+        if tile_route is None:
+            continue
 
-def _write_compute_manifest(date: str, hour: int, route_tiles: List[Tuple[int, int]]) -> None:
-    manifest_dir = RESULTS_DIR / date.replace('-', '') / f'{hour:02d}'
-    manifest_dir.mkdir(parents=True, exist_ok=True)
-    manifest_file = manifest_dir / 'compute_manifest.json'
-    payload = HeatComputeManifest(date=date, hour=hour, route_tiles=route_tiles).model_dump()
-    manifest_file.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding='utf-8')
+        tile_bbox = tile_route[0]
+        tile_prefix = f'r{row}_c{col}'
+        hour_tile_results.append(
+            HeatTileResult(
+                row=row,
+                col=col,
+                png_url=f'/results/{date_folder}/{hour_folder}/tiles/{tile_prefix}.png',
+                tif_url=f'/results/{date_folder}/{hour_folder}/tiles/{tile_prefix}.tif',
+                bounds=((tile_bbox[0], tile_bbox[1]), (tile_bbox[2], tile_bbox[3])),
+            )
+        )
 
+    return HeatSeriesHourResult(hour=hour, tiles=hour_tile_results)
 
-@app.get('/api/heat/mock', response_model=HeatMockResponse)
-def build_mock_heat_layer(
-    date: str = Query(..., description='YYYY-MM-DD'),
-    hour: int = Query(..., ge=0, le=23),
-    bbox: str = Query(..., description='minLng,minLat,maxLng,maxLat'),
-) -> HeatMockResponse:
+
+def _init_series_worker() -> None:
+    global _KDTREE_WORKERS
+    # The pool already runs one process per core; keep each worker's KD-tree query single-threaded.
+    _KDTREE_WORKERS = 1
+    # Build the shared KD-tree query grid up front instead of on each worker's first task.
+    _route_grid(256)
+
+
+@functools.lru_cache(maxsize=1)
+def _series_process_pool() -> ProcessPoolExecutor:
+    # spawn, not fork: the server process already runs event-loop and native library threads.
+    return ProcessPoolExecutor(
+        max_workers=SERIES_MAX_WORKERS,
+        mp_context=multiprocessing.get_context('spawn'),
+        initializer=_init_series_worker,
+    )
+
+
+def _shutdown_series_process_pool(wait: bool, pool: Optional[ProcessPoolExecutor] = None) -> None:
+    # Only shut down a pool that was actually started; the next _series_process_pool() call builds a fresh one.
+    # With `pool` given, act only while it is still the cached one: another request may already have replaced
+    # it, and the replacement's tasks must not be cancelled.
+    if not _series_process_pool.cache_info().currsize:
+        return
+    current = _series_process_pool()
+    if pool is not None and pool is not current:
+        return
+    _series_process_pool.cache_clear()
+    current.shutdown(wait=wait, cancel_futures=True)
+
+
+# Query dependencies: handlers receive validated values, malformed input still answers 400 with the same details.
+# They are async on purpose so FastAPI calls them inline instead of dispatching each one to the thread pool.
+async def _date_param(date: str = Query(..., description='YYYY-MM-DD')) -> str:
     try:
         datetime.strptime(date, '%Y-%m-%d')
     except ValueError as exc:
         raise HTTPException(status_code=400, detail='date must match YYYY-MM-DD.') from exc
+    return date
 
-    parsed_bbox = _parse_bbox(bbox)
-    seed = _stable_seed(f'{date}-{hour}-{";".join(str(v) for v in parsed_bbox)}')
-    heat_norm = _mock_heat_array(seed=seed)
-    heat_utci = (heat_norm * 40.0).astype(np.float32)
 
+async def _bbox_param(
+    bbox: str = Query(..., description='minLng,minLat,maxLng,maxLat'),
+) -> Tuple[float, float, float, float]:
+    return _parse_bbox(bbox)
+
+
+async def _start_param(start: str = Query(..., description='lng,lat')) -> Tuple[float, float]:
+    return _parse_lng_lat(start, 'start')
+
+
+async def _end_param(end: str = Query(..., description='lng,lat')) -> Tuple[float, float]:
+    return _parse_lng_lat(end, 'end')
+
+
+async def _hours_param(
+    start_hour: Optional[int] = Query(default=None, ge=0, le=23),
+    n_hours: Optional[int] = Query(default=None, ge=1, le=24),
+    hours: Optional[str] = Query(default=None, description='comma-separated hours'),
+) -> List[int]:
+    return _parse_hours(start_hour=start_hour, n_hours=n_hours, hours=hours)
+
+
+@app.get('/api/heat/mock', response_model=HeatMockResponse)
+def build_mock_heat_layer(
+    date: str = Depends(_date_param),
+    hour: int = Query(..., ge=0, le=23),
+    parsed_bbox: Tuple[float, float, float, float] = Depends(_bbox_param),
+) -> HeatMockResponse:
     date_folder = date.replace('-', '')
     hour_folder = f'{hour:02d}'
     output_dir = RESULTS_DIR / date_folder / hour_folder
-    output_dir.mkdir(parents=True, exist_ok=True)
-
     tif_file = output_dir / 'heat_exposure.tif'
     png_file = output_dir / 'heat_exposure.png'
 
-    if not (tif_file.exists() and png_file.exists()):
+    if not _outputs_exist(tif_file, png_file):
+        output_dir.mkdir(parents=True, exist_ok=True)
+        seed = _stable_seed(f'{date}-{hour}-{";".join(str(v) for v in parsed_bbox)}')
+        heat_utci = _mock_heat_array(seed=seed, out=_scratch_heat_buffer(256))
+        heat_utci *= np.float32(40.0)
         _write_geotiff(heat_utci, tif_file, parsed_bbox)
         _write_overlay_png_discrete(heat_utci, png_file)
+        _GENERATED_OUTPUTS.add(tif_file)
 
     min_lng, min_lat, max_lng, max_lat = parsed_bbox
     return HeatMockResponse(
@@ -599,79 +1098,64 @@ def build_mock_heat_layer(
 
 
 @app.get('/api/heat/mock/series', response_model=HeatSeriesResponse)
-def build_mock_heat_series(
-    date: str = Query(..., description='YYYY-MM-DD'),
-    start: str = Query(..., description='lng,lat'),
-    end: str = Query(..., description='lng,lat'),
-    start_hour: Optional[int] = Query(default=None, ge=0, le=23),
-    n_hours: Optional[int] = Query(default=None, ge=1, le=24),
-    hours: Optional[str] = Query(default=None, description='comma-separated hours'),
+async def build_mock_heat_series(
+    date: str = Depends(_date_param),
+    start_point: Tuple[float, float] = Depends(_start_param),
+    end_point: Tuple[float, float] = Depends(_end_param),
+    parsed_hours: List[int] = Depends(_hours_param),
     profile: str = Query(default='walking'),
 ) -> HeatSeriesResponse:
-    try:
-        datetime.strptime(date, '%Y-%m-%d')
-    except ValueError as exc:
-        raise HTTPException(status_code=400, detail='date must match YYYY-MM-DD.') from exc
+    # Seed tokens come from the parsed coordinates, so equivalent spellings of a point share a seed.
+    start = f'{start_point[0]},{start_point[1]}'
+    end = f'{end_point[0]},{end_point[1]}'
 
-    start_point = _parse_lng_lat(start, 'start')
-    end_point = _parse_lng_lat(end, 'end')
-    parsed_hours = _parse_hours(start_hour=start_hour, n_hours=n_hours, hours=hours)
+    route_array, tile_state, route_tiles = await _resolve_route_and_tiles(start_point, end_point, profile=profile)
 
-    route_coords = _fetch_route_geometry(start_point, end_point, profile=profile)
-    if route_coords is None:
-        route_coords = [[start_point[0], start_point[1]], [end_point[0], end_point[1]]]
-
-    tile_index = _load_tile_index()
-    route_tiles = _match_route_tiles(route_coords=route_coords, tile_index=tile_index)
-    tile_lookup = _tile_lookup_by_row_col(tile_index)
-
-    route_bbox = _expand_bbox(_bbox_from_route(route_coords), ratio=0.05)
+    route_bbox = _expand_bbox(_bbox_from_route(route_array), ratio=0.05)
     min_lng, min_lat, max_lng, max_lat = route_bbox
 
-    date_folder = date.replace('-', '')
-    items: List[HeatSeriesHourResult] = []
-
-    for hour in parsed_hours:
-        hour_folder = f'{hour:02d}'
-        output_dir = RESULTS_DIR / date_folder / hour_folder
-        tile_output_dir = output_dir / 'tiles'
-        tile_output_dir.mkdir(parents=True, exist_ok=True)
-
-        hour_tile_results: List[HeatTileResult] = []
-        for row, col in route_tiles:
-            tile_meta = tile_lookup.get((row, col))
-            if not tile_meta:
-                continue
-
-            tile_bbox = (
-                float(tile_meta['min_lng']),
-                float(tile_meta['min_lat']),
-                float(tile_meta['max_lng']),
-                float(tile_meta['max_lat']),
-            )
+    # Route preparation and the output scan are CPU/disk work; run them on the thread pool.
+    tile_routes = await asyncio.to_thread(_series_tile_routes, route_array, route_tiles, tile_state.lookup)
+    # Render each distinct (hour, tile) once so concurrent workers never write the same files.
+    unique_hours = list(dict.fromkeys(parsed_hours))
+    pending_tiles = await asyncio.to_thread(_pending_series_work, RESULTS_DIR, date, unique_hours, tile_routes)
+    # Small batches stay on the default thread executor; larger ones fan out to the process pool.
+    pool = _series_process_pool() if len(pending_tiles) > SERIES_INLINE_MAX_TILES else None
 
-            tile_prefix = f'r{row}_c{col}'
-            tif_file = tile_output_dir / f'{tile_prefix}.tif'
-            png_file = tile_output_dir / f'{tile_prefix}.png'
-
-            if not (tif_file.exists() and png_file.exists()):
-                seed = _stable_seed(f'{date}-{hour}-{row}-{col}-{start}-{end}')
-                heat = _generate_route_weighted_heat(seed=seed, bbox=tile_bbox, route_coords=route_coords)
-                _write_geotiff(heat, tif_file, tile_bbox)
-                _write_overlay_png_discrete(heat, png_file)
-
-            hour_tile_results.append(
-                HeatTileResult(
-                    row=row,
-                    col=col,
-                    png_url=f'/results/{date_folder}/{hour_folder}/tiles/{png_file.name}',
-                    tif_url=f'/results/{date_folder}/{hour_folder}/tiles/{tif_file.name}',
-                    bounds=((tile_bbox[0], tile_bbox[1]), (tile_bbox[2], tile_bbox[3])),
+    loop = asyncio.get_running_loop()
+    try:
+        await asyncio.gather(
+            *(
+                loop.run_in_executor(
+                    pool,
+                    _render_series_tile,
+                    RESULTS_DIR,
+                    date,
+                    hour,
+                    row,
+                    col,
+                    *tile_routes[(row, col)],
+                    start,
+                    end,
                 )
-            )
+                for hour, row, col in pending_tiles
+            ),
+            *(
+                loop.run_in_executor(
+                    None, functools.partial(_write_compute_manifest, RESULTS_DIR, date, hour, route_tiles)
+                )
+                for hour in unique_hours
+            ),
+        )
+    except BrokenProcessPool as exc:
+        # A worker died (e.g. killed for memory); drop the pool so the next request starts a fresh one.
+        _shutdown_series_process_pool(wait=False, pool=pool)
+        raise HTTPException(status_code=503, detail='Tile rendering workers stopped; retry the request.') from exc
+    for hour, row, col in pending_tiles:
+        _GENERATED_OUTPUTS.add(_series_tile_files(RESULTS_DIR, date, hour, row, col)[0])
 
-        _write_compute_manifest(date=date, hour=hour, route_tiles=route_tiles)
-        items.append(HeatSeriesHourResult(hour=hour, tiles=hour_tile_results))
+    results_by_hour = {hour: _series_hour_result(date, hour, route_tiles, tile_routes) for hour in unique_hours}
+    items = [results_by_hour[hour] for hour in parsed_hours]
 
     return HeatSeriesResponse(
         date=date,
@@ -683,20 +1167,12 @@ def build_mock_heat_series(
 
 
 @app.get('/api/tiles/route', response_model=TileMatchResponse)
-def get_route_tile_matches(
-    start: str = Query(..., description='lng,lat'),
-    end: str = Query(..., description='lng,lat'),
+async def get_route_tile_matches(
+    start_point: Tuple[float, float] = Depends(_start_param),
+    end_point: Tuple[float, float] = Depends(_end_param),
     profile: str = Query(default='walking'),
 ) -> TileMatchResponse:
-    start_point = _parse_lng_lat(start, 'start')
-    end_point = _parse_lng_lat(end, 'end')
-
-    route_coords = _fetch_route_geometry(start_point, end_point, profile=profile)
-    if route_coords is None:
-        route_coords = [[start_point[0], start_point[1]], [end_point[0], end_point[1]]]
-
-    tile_index = _load_tile_index()
-    route_tiles = _match_route_tiles(route_coords=route_coords, tile_index=tile_index)
+    _route_array, _tile_state, route_tiles = await _resolve_route_and_tiles(start_point, end_point, profile=profile)
     return TileMatchResponse(route_tiles=route_tiles)
 
 
@@ -708,21 +1184,3 @@ def get_tile_index_meta() -> TileIndexMetaResponse:
         file_exists=TILE_INDEX_PATH.exists(),
         tile_count=len(tile_index),
     )
-
-
-@app.get('/api/tiles/route', response_model=TileMatchResponse)
-def get_route_tile_matches(
-    start: str = Query(..., description='lng,lat'),
-    end: str = Query(..., description='lng,lat'),
-    profile: str = Query(default='walking'),
-) -> TileMatchResponse:
-    start_point = _parse_lng_lat(start, 'start')
-    end_point = _parse_lng_lat(end, 'end')
-
-    route_coords = _fetch_route_geometry(start_point, end_point, profile=profile)
-    if route_coords is None:
-        route_coords = [[start_point[0], start_point[1]], [end_point[0], end_point[1]]]
-
-    tile_index = _load_tile_index()
-    route_tiles = _match_route_tiles(route_coords=route_coords, tile_index=tile_index)
-    return TileMatchResponse(route_tiles=route_tiles)